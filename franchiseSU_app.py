@@ -1,99 +1,311 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import numpy_financial as npf
+import pandas as pd
 import fpdf
 from fpdf import FPDF
-import tempfile
+from collections import namedtuple
+from itertools import groupby
+
+# Baseline cost/profit percentages, kept as a single vector so the hot path
+# is one vectorized multiply instead of eight scalar ones per rerun.
+# Everything stays float64: these vectors are tiny, and narrowing them
+# shifts displayed dollar figures
+_LABELS = ('cogs', 'labor', 'occupancy', 'operating', 'royalties',
+           'franchise_expense', 'gross_profit')
+_PCTS = np.array([
+    0.2443,  # Cost of Goods Sold: 24.43%
+    0.3138,  # Labor Cost: 31.38%
+    0.1150,  # Occupancy Cost: 11.50%
+    0.0095,  # Operating Expenses: 0.95%
+    0.0400,  # Royalties: 4.00%
+    0.0268,  # Franchise-Related: 2.68%
+    0.2507   # Gross Profit: 25.07%
+])
+
+Financials = namedtuple('Financials', ('revenue',) + _LABELS)
+
+# 10-year projection horizon, shared by every projection helper
+_YEARS = np.arange(1, 11, dtype=np.float64)
+_EXP = _YEARS - 1.0
 
 def calculate_financials(revenue):
     """Calculate all financial metrics based on baseline percentages"""
-    return {
-        'revenue': revenue,
-        'cogs': revenue * 0.2443,  # Cost of Goods Sold: 24.43%
-        'labor': revenue * 0.3138,  # Labor Cost: 31.38%
-        'occupancy': revenue * 0.1150,  # Occupancy Cost: 11.50%
-        'operating': revenue * 0.0095,  # Operating Expenses: 0.95%
-        'royalties': revenue * 0.0400,  # Royalties: 4.00%
-        'franchise_expense': revenue * 0.0268,  # Franchise-Related: 2.68%
-        'gross_profit': revenue * 0.2507  # Gross Profit: 25.07%
-    }
+    values = revenue * _PCTS
+    return Financials(revenue, *values.tolist())
+
+# Baseline year (July 2023 - June 2024) is a constant, so fold its
+# metrics once at import instead of recomputing them per render
+_BASE_REVENUE = 530899
+_BASELINE_METRICS = calculate_financials(_BASE_REVENUE)
+
+# The baseline table never changes, so format it once at import and
+# emit it as a single st.markdown call per render
+_BASELINE_TABLE_MD = "| Metric | Value | % of Revenue |\n|---|---|---|\n" + "\n".join(
+    f"| {key.replace('_', ' ').title()} | ${value:,.2f} | {value/_BASE_REVENUE*100:.2f}% |"
+    for key, value in zip(('revenue',) + _LABELS, _BASELINE_METRICS)
+)
+
+def _npv(rate, values):
+    """Net present value via Horner evaluation: one multiply-add per
+    cashflow, no per-call array temporaries"""
+    inv = 1.0 / (1.0 + rate)
+    acc = inv
+    npv = float(values[0])
+    for value in values[1:]:
+        npv += value * acc
+        acc *= inv
+    return npv
+
+def _irr_newton(cash_flows, guess=0.1, tol=1e-7, max_iter=50, bound=1e6):
+    """Bounded Newton-Raphson IRR solver; returns None if the iteration
+    diverges or leaves the solvable domain"""
+    periods = np.arange(cash_flows.size)
+    rate = guess
+    for _ in range(max_iter):
+        discount = (1 + rate) ** periods
+        f = (cash_flows / discount).sum()
+        f_prime = -(periods * cash_flows / (discount * (1 + rate))).sum()
+        if f_prime == 0:
+            break
+        step = f / f_prime
+        rate -= step
+        # Bail out of the domain boundary or a runaway iterate before the
+        # power blows up into overflow territory
+        if rate <= -1 or abs(rate) > bound:
+            break
+        if abs(step) < tol:
+            return rate
+    return None
 
+@st.cache_data(max_entries=256)
+def _cached_irr(cf_tuple):
+    """IRR memoized on the cashflow vector so reruns with unchanged inputs skip the solve"""
+    cash_flows = np.ascontiguousarray(cf_tuple, dtype=np.float64)
+    # Newton converges in a handful of iterations for these cashflows;
+    # npf.irr's companion-matrix eigendecomposition is the fallback
+    rate = _irr_newton(cash_flows)
+    if rate is None:
+        # Deferred import: the fallback is rarely reached, so workers
+        # skip loading numpy_financial at cold start
+        import numpy_financial as npf
+        rate = npf.irr(cash_flows)
+    return rate
+
+@st.cache_data(max_entries=256)
 def calculate_npv_metrics(initial_investment, cash_flows, discount_rate):
     """Calculate NPV, IRR, and payback period"""
     # Add initial investment as first cash flow (negative)
-    full_cash_flows = [-initial_investment] + cash_flows
-    
+    full_cash_flows = np.empty(len(cash_flows) + 1, dtype=np.float64)
+    full_cash_flows[0] = -initial_investment
+    full_cash_flows[1:] = cash_flows
+
     # NPV calculation
-    npv = npf.npv(discount_rate/100, full_cash_flows)
-    
-    # IRR calculation
-    try:
-        irr = npf.irr(full_cash_flows) * 100
-    except:
-        irr = None
-    
-    # Payback period calculation
-    cumulative = np.cumsum(full_cash_flows)
-    payback = np.where(cumulative >= 0)[0]
-    if len(payback) > 0:
-        payback_period = payback[0]
-        # Interpolate for more accurate payback period
-        if payback_period > 0:
-            prev_cum = cumulative[payback_period-1]
-            curr_cum = cumulative[payback_period]
-            payback_period = payback_period - 1 + abs(prev_cum) / (curr_cum - prev_cum)
-    else:
-        payback_period = None
-    
+    npv = _npv(discount_rate/100, full_cash_flows)
+    
+    # IRR calculation; round to cents so float noise doesn't defeat the cache.
+    # npf.irr signals "no real solution" with nan rather than raising
+    irr = _cached_irr(tuple(np.round(full_cash_flows, 2)))
+    irr = irr * 100 if irr is not None and np.isfinite(irr) else None
+    
+    # Payback period calculation: a running-sum scan with interpolation at
+    # the sign change. At eleven elements the scalar loop beats allocating
+    # cumsum and index arrays
+    cumulative = float(full_cash_flows[0])
+    payback_period = 0 if cumulative >= 0 else None
+    if payback_period is None:
+        for year in range(1, len(full_cash_flows)):
+            prev_cum = cumulative
+            cumulative += full_cash_flows[year]
+            if cumulative >= 0:
+                # Interpolate for more accurate payback period
+                payback_period = year - 1 + abs(prev_cum) / (cumulative - prev_cum)
+                break
+
     return npv, irr, payback_period
 
-def calculate_scenario_revenues(base_revenue, scenario, growth_rate, years):
+# Scenario defaults as plain lookups instead of repeated if/elif chains
+_REV_START_PCTS = {'Weak Demand': -15, 'Average Demand': 0, 'Above Average Demand': 15}
+_REV_GROWTH_DEFAULTS = {'Weak Demand': 1.0, 'Average Demand': 5.0, 'Above Average Demand': 10.0}
+# The analysis tab uses industry-standard growth defaults instead
+_FIN_GROWTH_DEFAULTS = {'Weak Demand': 3.0, 'Average Demand': 7.0, 'Above Average Demand': 12.0}
+_COST_GROWTH_DEFAULTS = {'Below Average Costs': 2.0, 'Average Costs': 3.0, 'Above Average Costs': 7.0}
+
+def calculate_scenario_revenues(base_revenue, scenario, growth_rate):
     """Calculate revenue projections for a given scenario"""
-    if scenario == 'Weak Demand':
-        start_pct = -15
-    elif scenario == 'Above Average Demand':
-        start_pct = 15
-    else:  # Average Demand
-        start_pct = 0
-        
+    start_pct = _REV_START_PCTS.get(scenario, 0)
     starting_revenue = base_revenue * (1 + start_pct/100)
-    return [starting_revenue * (1 + growth_rate/100) ** (year-1) for year in years]
+    # Each year is the previous year times (1+g): a cumulative product,
+    # one multiply per year instead of repeated exponentiation
+    return starting_revenue * _compound_factors(1 + growth_rate/100)
 
-def calculate_adjusted_margins(base_margin, years, cost_growth_rate):
+def calculate_adjusted_margins(base_margin, cost_growth_rate):
     """Calculate margins accounting for compound cost growth effects"""
-    adjusted_margins = []
-    for year in years:
-        # Compound effect of cost increases
-        cost_multiplier = (1 + cost_growth_rate/100) ** (year-1)
-        # Margin compression follows a more natural curve
-        new_margin = base_margin / cost_multiplier
-        adjusted_margins.append(new_margin)
-    return adjusted_margins
+    # Compound effect of cost increases; margin compression follows
+    # a more natural curve than a linear decline
+    return base_margin * _compound_factors(1 / (1 + cost_growth_rate/100))
+
+@st.cache_data
+def project_scenario(scenario, growth_rate, cost_growth_rate,
+                     base_revenue=_BASE_REVENUE, base_margin=0.2507):
+    """Project revenues, margins and profits for one scenario combination.
+
+    Shared by the projection and analysis tabs so switching tabs (or
+    re-entering the same inputs) hits the cache instead of recomputing.
+    """
+    revenues = calculate_scenario_revenues(base_revenue, scenario, growth_rate)
+    margins = calculate_adjusted_margins(base_margin, cost_growth_rate)
+    return revenues, margins, revenues * margins
+
+def _compound_factors(step):
+    """Vector (1, step, step**2, ...) over the horizon via one cumprod pass"""
+    factors = np.empty(_YEARS.size, dtype=np.float64)
+    factors[0] = 1.0
+    factors[1:] = step
+    np.cumprod(factors, out=factors)
+    return factors
+
+# Figure layouts validated once at import; go.Figure copies the layout,
+# so the constants can be shared by every build
+_COST_COMPARISON_LAYOUT = go.Layout(
+    template="plotly_white",
+    title="Investment Requirements Comparison",
+    yaxis_title="Total Investment ($)",
+    showlegend=False
+)
+_PROJECTION_LAYOUT = go.Layout(
+    template="plotly_white",
+    xaxis_title="Year",
+    yaxis_title="Amount ($)"
+)
+_MARGIN_LAYOUT = go.Layout(
+    template="plotly_white",
+    title="Gross Margin Projection",
+    xaxis_title="Year",
+    yaxis_title="Gross Margin (%)"
+)
+_TORNADO_LAYOUT = go.Layout(
+    template='plotly_white',
+    title='NPV Sensitivity Analysis',
+    xaxis_title='Change in NPV ($)',
+    yaxis_title='Parameter',
+    barmode='overlay',
+    bargap=0.1,
+    height=400
+)
+
+@st.cache_resource
+def _plotly_defaults():
+    """Shared color palette, resolved once across all sessions"""
+    return {
+        'cost_colors': {
+            'Low Cost': 'green',
+            'Average Cost': 'blue',
+            'High Cost': 'red',
+            'Current Selection': 'purple'
+        }
+    }
+
+@st.cache_data
+def _build_cost_comparison_fig(scenario_items):
+    """Bar chart of scenario totals, cached on the (name, amount) pairs"""
+    colors = _plotly_defaults()['cost_colors']
+
+    # One Bar trace with per-bar color/opacity arrays instead of one
+    # single-bar trace per scenario: a quarter of the JSON payload
+    names = [scenario for scenario, _ in scenario_items]
+    return go.Figure(data=[
+        go.Bar(
+            x=names,
+            y=[amount for _, amount in scenario_items],
+            marker=dict(
+                color=[colors[s] for s in names],
+                opacity=[1 if s == 'Current Selection' else 0.7 for s in names]
+            ),
+            width=0.4
+        )
+    ], layout=_COST_COMPARISON_LAYOUT)
+
+@st.cache_data
+def _build_projection_fig(revenues, profits, title):
+    """Revenue/profit projection lines, cached on the numeric inputs"""
+    return go.Figure(data=[
+        go.Scattergl(
+            x=_YEARS,
+            y=revenues,
+            name='Revenue',
+            line=dict(color='blue')
+        ),
+        go.Scattergl(
+            x=_YEARS,
+            y=profits,
+            name='Profit',
+            line=dict(color='green')
+        )
+    ], layout=go.Layout(_PROJECTION_LAYOUT, title=title))
+
+@st.cache_data
+def _build_margin_fig(adjusted_margins, base_margin):
+    """Gross-margin projection against the baseline, cached on the margin curve"""
+    return go.Figure(data=[
+        go.Scattergl(
+            x=_YEARS,
+            y=np.asarray(adjusted_margins) * 100,
+            name='Adjusted Gross Margin',
+            line=dict(color='blue')
+        ),
+        go.Scattergl(
+            x=_YEARS,
+            y=np.full(_YEARS.size, base_margin * 100),
+            name='Base Gross Margin',
+            line=dict(color='gray', dash='dash')
+        )
+    ], layout=_MARGIN_LAYOUT)
+
+# Startup cost table as parallel arrays (category, low, high) so the
+# scenario totals are computed once at import instead of per rerun
+_COST_CATEGORIES = (
+    'Initial Franchise Fee',
+    'Computer System',
+    'Insurance',
+    'Professional Fees',
+    'Travel, Lodging, and Meals',
+    'Equipment',
+    'Construction and Leasehold Improvements',
+    'Signage',
+    'Permits and Licenses',
+    'Project Management & Architect Fees',
+    'Office Equipment and Supplies',
+    'Initial Inventory',
+    'Utilities Lease and Security Deposits',
+    'Grand Opening and Initial Advertising',
+    'Pre-opening Employee Wages',
+    'Additional Funds (3 Months)'
+)
+_COST_LOWS = np.array([
+    35000.0, 5000.0, 5000.0, 5000.0, 2000.0, 100000.0, 200000.0, 6000.0,
+    500.0, 10000.0, 500.0, 8000.0, 4500.0, 5000.0, 1000.0, 40000.0
+], dtype=np.float32)
+_COST_HIGHS = np.array([
+    35000.0, 8000.0, 7000.0, 7500.0, 8000.0, 160000.0, 460000.0, 20000.0,
+    5000.0, 35000.0, 1000.0, 12000.0, 30000.0, 10000.0, 5000.0, 80000.0
+], dtype=np.float32)
+_COST_AVGS = (_COST_LOWS + _COST_HIGHS) / 2
+_SCENARIO_COSTS = {
+    'Low Cost': _COST_LOWS,
+    'Average Cost': _COST_AVGS,
+    'High Cost': _COST_HIGHS
+}
+_SCENARIO_TOTALS = {
+    'Low Cost': float(_COST_LOWS.sum()),
+    'Average Cost': float(_COST_AVGS.sum()),
+    'High Cost': float(_COST_HIGHS.sum())
+}
 
+@st.fragment
 def startup_costs_tab():
     st.title('Startup Costs Analysis')
-    
-    # Create startup costs dictionary with default values (all as float)
-    default_startup_costs = {
-        'Initial Franchise Fee': {'low': 35000.0, 'high': 35000.0},
-        'Computer System': {'low': 5000.0, 'high': 8000.0},
-        'Insurance': {'low': 5000.0, 'high': 7000.0},
-        'Professional Fees': {'low': 5000.0, 'high': 7500.0},
-        'Travel, Lodging, and Meals': {'low': 2000.0, 'high': 8000.0},
-        'Equipment': {'low': 100000.0, 'high': 160000.0},
-        'Construction and Leasehold Improvements': {'low': 200000.0, 'high': 460000.0},
-        'Signage': {'low': 6000.0, 'high': 20000.0},
-        'Permits and Licenses': {'low': 500.0, 'high': 5000.0},
-        'Project Management & Architect Fees': {'low': 10000.0, 'high': 35000.0},
-        'Office Equipment and Supplies': {'low': 500.0, 'high': 1000.0},
-        'Initial Inventory': {'low': 8000.0, 'high': 12000.0},
-        'Utilities Lease and Security Deposits': {'low': 4500.0, 'high': 30000.0},
-        'Grand Opening and Initial Advertising': {'low': 5000.0, 'high': 10000.0},
-        'Pre-opening Employee Wages': {'low': 1000.0, 'high': 5000.0},
-        'Additional Funds (3 Months)': {'low': 40000.0, 'high': 80000.0}
-    }
-    
+
     # Scenario Selection
     cost_scenario = st.selectbox(
         'Select Cost Scenario',
@@ -101,49 +313,39 @@ def startup_costs_tab():
         key='cost_scenario_select'
     )
     
-    # Calculate scenario totals for use in other tabs
-    st.session_state.startup_costs = {
-        'Low Cost': sum(v['low'] for v in default_startup_costs.values()),
-        'Average Cost': sum((v['low'] + v['high'])/2 for v in default_startup_costs.values()),
-        'High Cost': sum(v['high'] for v in default_startup_costs.values())
-    }
-    
+    # Precomputed scenario totals for use in other tabs
+    st.session_state.startup_costs = dict(_SCENARIO_TOTALS)
+
     # Initialize or reset session state for current costs when scenario changes
     if 'current_costs' not in st.session_state or st.session_state.get('last_scenario') != cost_scenario:
-        if cost_scenario == 'Low Cost':
-            st.session_state.current_costs = {k: float(v['low']) for k, v in default_startup_costs.items()}
-        elif cost_scenario == 'High Cost':
-            st.session_state.current_costs = {k: float(v['high']) for k, v in default_startup_costs.items()}
-        else:  # Average Cost
-            st.session_state.current_costs = {k: float((v['low'] + v['high'])/2) for k, v in default_startup_costs.items()}
+        st.session_state.current_costs = dict(
+            zip(_COST_CATEGORIES, _SCENARIO_COSTS[cost_scenario].tolist()))
         st.session_state.last_scenario = cost_scenario
-    
-    # Display costs breakdown with adjustable inputs
+
+    # Display costs breakdown as one editable grid instead of 16
+    # st.columns/st.number_input pairs (one widget payload per rerun)
     st.header('Startup Costs Breakdown')
-    
-    total_cost = 0.0  # Initialize as float
-    for category in default_startup_costs.keys():
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.write(f"**{category}**")
-        with col2:
-            # Get min and max values for this category
-            min_val = float(default_startup_costs[category]['low'])
-            max_val = float(default_startup_costs[category]['high'])
-            
-            # Create number input with appropriate step size
-            step = 100.0 if max_val > 10000.0 else 50.0
-            current_value = st.number_input(
-                f"Amount for {category}",
-                min_value=float(min_val * 0.5),  # Convert to float
-                max_value=float(max_val * 1.5),  # Convert to float
-                value=float(st.session_state.current_costs[category]),  # Convert to float
-                step=step,
-                key=f"input_{category}",
-                label_visibility="collapsed"
-            )
-            st.session_state.current_costs[category] = float(current_value)
-            total_cost += current_value
+
+    costs_df = pd.DataFrame({
+        'Category': _COST_CATEGORIES,
+        'Amount': [st.session_state.current_costs[c] for c in _COST_CATEGORIES]
+    })
+    edited_df = st.data_editor(
+        costs_df,
+        hide_index=True,
+        disabled=['Category'],
+        column_config={
+            'Amount': st.column_config.NumberColumn(format='$%.2f')
+        },
+        use_container_width=True,
+        key='startup_costs_editor'
+    )
+
+    # Clamp edits to the same per-category bounds the old inputs enforced
+    amounts = np.clip(edited_df['Amount'].to_numpy(dtype=np.float64),
+                      _COST_LOWS * 0.5, _COST_HIGHS * 1.5)
+    st.session_state.current_costs = dict(zip(_COST_CATEGORIES, amounts.tolist()))
+    total_cost = float(amounts.sum())
     
     st.markdown("---")
     st.header('Total Investment Required')
@@ -151,49 +353,18 @@ def startup_costs_tab():
     
     # Add comparison visualization
     st.header('Cost Comparison')
-    fig = go.Figure()
-    
-    # Calculate scenario totals
-    scenarios = {
-        'Low Cost': sum(v['low'] for v in default_startup_costs.values()),
-        'Average Cost': sum((v['low'] + v['high'])/2 for v in default_startup_costs.values()),
-        'High Cost': sum(v['high'] for v in default_startup_costs.values())
-    }
-    
-    # Add current total to scenarios
+
+    # Precomputed scenario totals plus the current total
+    scenarios = dict(_SCENARIO_TOTALS)
     scenarios['Current Selection'] = total_cost
-    
-    colors = {
-        'Low Cost': 'green',
-        'Average Cost': 'blue',
-        'High Cost': 'red',
-        'Current Selection': 'purple'
-    }
-    
-    for scenario, amount in scenarios.items():
-        fig.add_trace(
-            go.Bar(
-                name=scenario,
-                x=[scenario],
-                y=[amount],
-                marker_color=colors[scenario],
-                width=0.4,
-                opacity=1 if scenario == 'Current Selection' else 0.7
-            )
-        )
-    
-    fig.update_layout(
-        title="Investment Requirements Comparison",
-        yaxis_title="Total Investment ($)",
-        showlegend=False,
-        template='plotly_white'
-    )
-    
+
+    fig = _build_cost_comparison_fig(tuple(scenarios.items()))
     st.plotly_chart(fig, use_container_width=True)
     
     # Store the current total in session state for other tabs
     st.session_state.current_total_investment = total_cost
 
+@st.fragment
 def revenue_projections_tab():
     st.title('Revenue Projections Analysis')
     
@@ -208,13 +379,8 @@ def revenue_projections_tab():
     
     with col2:
         # Adjust default growth rate based on scenario
-        if selected_revenue == 'Weak Demand':
-            default_growth = 1.0
-        elif selected_revenue == 'Above Average Demand':
-            default_growth = 10.0
-        else:
-            default_growth = 5.0
-            
+        default_growth = _REV_GROWTH_DEFAULTS[selected_revenue]
+
         growth_rate = st.slider(
             'Annual Growth Rate (%)',
             min_value=-2.0,
@@ -232,13 +398,8 @@ def revenue_projections_tab():
         )
     
     with col4:
-        if cost_scenario == 'Below Average Costs':
-            default_cost_growth = 2.0
-        elif cost_scenario == 'Above Average Costs':
-            default_cost_growth = 7.0
-        else:
-            default_cost_growth = 3.0
-            
+        default_cost_growth = _COST_GROWTH_DEFAULTS[cost_scenario]
+
         cost_growth_rate = st.number_input(
             'Annual Cost Growth Rate (%)',
             min_value=-5.0,
@@ -249,44 +410,28 @@ def revenue_projections_tab():
         )
 
     # Calculate projections
-    base_revenue = 530899
-    years = range(1, 11)
-    revenues = calculate_scenario_revenues(base_revenue, selected_revenue, growth_rate, years)
+    base_revenue = _BASE_REVENUE
     base_margin = 0.2507
-    adjusted_margins = calculate_adjusted_margins(base_margin, years, cost_growth_rate)
-    profits = [rev * margin for rev, margin in zip(revenues, adjusted_margins)]
+    revenues, adjusted_margins, profits = project_scenario(
+        selected_revenue, growth_rate, cost_growth_rate)
 
     # Display projection chart first
     st.header('Revenue and Profit Projections')
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=list(years),
-        y=revenues,
-        name='Revenue',
-        line=dict(color='blue')
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=list(years),
-        y=profits,
-        name='Profit',
-        line=dict(color='green')
-    ))
-    
-    fig.update_layout(
-        title=f"{selected_revenue} Scenario ({growth_rate:+.1f}% Growth)",
-        xaxis_title="Year",
-        yaxis_title="Amount ($)",
-        template='plotly_white'
+    fig = _build_projection_fig(
+        tuple(revenues), tuple(profits),
+        f"{selected_revenue} Scenario ({growth_rate:+.1f}% Growth)"
     )
-    
     st.plotly_chart(fig, use_container_width=True)
 
     # Scenario Impact Analysis with clear grouping and consistent metrics
     st.header('Scenario Impact Analysis')
     
-    # Calculate all metrics first
+    # Calculate all metrics first; each array is summed once and reused
+    revenue_sum = revenues.sum()
+    profit_sum = profits.sum()
+    revenue_mean = revenue_sum / revenues.size
+    profit_mean = profit_sum / profits.size
+    margin_mean = adjusted_margins.sum() / adjusted_margins.size
     metrics = {
         'Year 1': {
             'revenue': revenues[0],
@@ -305,93 +450,52 @@ def revenue_projections_tab():
             'margin_change': (adjusted_margins[-1]/base_margin - 1) * 100
         },
         '10-Year Average': {
-            'revenue': sum(revenues) / len(revenues),
-            'monthly_revenue': sum(revenues) / len(revenues) / 12,
-            'profit': sum(profits) / len(profits),
-            'margin': sum(profits) / sum(revenues),
+            'revenue': revenue_mean,
+            'monthly_revenue': revenue_mean / 12,
+            'profit': profit_mean,
+            'margin': profit_sum / revenue_sum,
             'avg_annual_growth': ((revenues[-1]/revenues[0]) ** (1/9) - 1) * 100,
-            'avg_margin_impact': (sum(adjusted_margins) / len(adjusted_margins) / base_margin - 1) * 100
+            'avg_margin_impact': (margin_mean / base_margin - 1) * 100
         }
     }
 
     # Create three columns
     col1, col2, col3 = st.columns(3)
     
-    # Display metrics in a consistent format
+    # Display metrics in a consistent format: one markdown block per
+    # column instead of seven separate writes
     columns = [col1, col2, col3]
     for col, (period, data) in zip(columns, metrics.items()):
-        with col:
-            st.subheader(period)
-            
-            # Annual Revenue (consistent across all periods)
-            st.write("##### Annual Revenue")
-            st.write(f"${data['revenue']:,.0f}")
-            
-            # Monthly Revenue (consistent across all periods)
-            st.write("##### Monthly Revenue")
-            st.write(f"${data['monthly_revenue']:,.0f}")
-            
-            # Profit (consistent across all periods)
-            st.write("##### Profit")
-            st.write(f"${data['profit']:,.0f}")
-            
-            # Margin (consistent across all periods)
-            st.write("##### Margin")
-            st.write(f"{(data['margin'] * 100):.1f}%")
-            
-            # Period-specific metrics
-            st.write("##### Change Metrics")
-            if period == 'Year 1':
-                st.write(f"Revenue vs Baseline: {data['revenue_change']:+.1f}%")
-                st.write(f"Profit vs Baseline: {data['profit_change']:+.1f}%")
-            elif period == 'Year 10':
-                st.write(f"Total Revenue Growth: {data['revenue_change']:+.1f}%")
-                st.write(f"Total Margin Impact: {data['margin_change']:+.1f}%")
-            else:  # 10-Year Average
-                st.write(f"Avg Annual Growth: {data['avg_annual_growth']:+.1f}%")
-                st.write(f"Avg Margin Impact: {data['avg_margin_impact']:+.1f}%")
+        if period == 'Year 1':
+            changes = (f"Revenue vs Baseline: {data['revenue_change']:+.1f}%\n\n"
+                       f"Profit vs Baseline: {data['profit_change']:+.1f}%")
+        elif period == 'Year 10':
+            changes = (f"Total Revenue Growth: {data['revenue_change']:+.1f}%\n\n"
+                       f"Total Margin Impact: {data['margin_change']:+.1f}%")
+        else:  # 10-Year Average
+            changes = (f"Avg Annual Growth: {data['avg_annual_growth']:+.1f}%\n\n"
+                       f"Avg Margin Impact: {data['avg_margin_impact']:+.1f}%")
+
+        col.markdown(
+            f"### {period}\n"
+            f"##### Annual Revenue\n${data['revenue']:,.0f}\n"
+            f"##### Monthly Revenue\n${data['monthly_revenue']:,.0f}\n"
+            f"##### Profit\n${data['profit']:,.0f}\n"
+            f"##### Margin\n{(data['margin'] * 100):.1f}%\n"
+            f"##### Change Metrics\n{changes}"
+        )
 
     # Move baseline metrics to the bottom
     st.header('Baseline Performance (July 2023 - June 2024)')
-    
-    col4, col5 = st.columns(2)
-    
-    with col4:
-        st.subheader('Revenue Metrics')
-        baseline_metrics = calculate_financials(base_revenue)
-        st.write(f"Gross Revenue: ${base_revenue:,.2f}")
-        st.write(f"Gross Profit: ${baseline_metrics['gross_profit']:,.2f}")
-    
-    with col5:
-        st.subheader('Cost Metrics')
-        for key, value in baseline_metrics.items():
-            if key not in ['revenue', 'gross_profit']:
-                st.write(f"{key.replace('_', ' ').title()}: ${value:,.2f} ({value/base_revenue*100:.2f}%)")
-
-def calculate_sensitivity_npv(base_params, param_name, variation_pct):
-    """Calculate NPV for parameter variations"""
-    params = base_params.copy()
-    
-    # Adjust the specified parameter up and down by variation_pct
-    if param_name == 'initial_investment':
-        params[param_name] = base_params[param_name] * (1 + variation_pct/100)
-    elif param_name == 'growth_rate':
-        params[param_name] = base_params[param_name] + variation_pct
-    elif param_name == 'discount_rate':
-        params[param_name] = base_params[param_name] + variation_pct
-    elif param_name == 'cost_growth':
-        params[param_name] = base_params[param_name] + variation_pct
-    
-    # Recalculate cash flows with new parameters
-    years = range(1, 11)
-    revenues = [params['base_revenue'] * (1 + params['growth_rate']/100) ** (year-1) for year in years]
-    adjusted_margins = [0.2507 * (1 - (params['cost_growth']/100) * year) for year in years]
-    cash_flows = [rev * margin for rev, margin in zip(revenues, adjusted_margins)]
-    
-    # Calculate NPV with new cash flows
-    full_cash_flows = [-params['initial_investment']] + cash_flows
-    return npf.npv(params['discount_rate']/100, full_cash_flows)
+    st.markdown(_BASELINE_TABLE_MD)
+
+# The five scenario inputs every sensitivity entry point shares; a
+# namedtuple hashes by field, so it doubles as a stable cache key
+BaseParams = namedtuple('BaseParams', (
+    'initial_investment', 'base_revenue', 'growth_rate',
+    'discount_rate', 'cost_growth'))
 
+@st.cache_data
 def create_tornado_plot(base_params):
     """Create tornado plot showing NPV sensitivity"""
     # Parameters to vary and their ranges
@@ -401,63 +505,70 @@ def create_tornado_plot(base_params):
         'discount_rate': {'variation': 2, 'label': 'Discount Rate (±2%)'},
         'cost_growth': {'variation': 2, 'label': 'Cost Growth Rate (2%)'}
     }
-    
-    # Calculate base NPV
-    base_npv = calculate_sensitivity_npv(base_params, 'initial_investment', 0)
-    
-    # Calculate NPV changes for each parameter
-    sensitivity_results = []
-    
-    for param, details in parameters.items():
-        # Calculate NPV for parameter increase and decrease
-        npv_increase = calculate_sensitivity_npv(base_params, param, details['variation'])
-        npv_decrease = calculate_sensitivity_npv(base_params, param, -details['variation'])
-        
-        # Store results
-        sensitivity_results.append({
-            'parameter': details['label'],
-            'npv_change_low': npv_decrease - base_npv,
-            'npv_change_high': npv_increase - base_npv
-        })
-    
+
+    # Build the rate scenarios (base + 3 parameters x 2 directions) as rows
+    # of parameter vectors so the NPVs come out of a single broadcast
+    # instead of one scalar solve per variation. The initial investment
+    # enters NPV undiscounted at t=0, so its delta is closed form and
+    # needs no scenario rows at all
+    growth = np.full(7, float(base_params.growth_rate))
+    discount = np.full(7, float(base_params.discount_rate))
+    cost_growth = np.full(7, float(base_params.cost_growth))
+
+    variation = parameters['growth_rate']['variation']
+    growth[1] -= variation
+    growth[2] += variation
+    variation = parameters['discount_rate']['variation']
+    discount[3] -= variation
+    discount[4] += variation
+    variation = parameters['cost_growth']['variation']
+    cost_growth[5] -= variation
+    cost_growth[6] += variation
+
+    # Linear-margin sensitivity model, broadcast over all scenarios
+    revenues = base_params.base_revenue * (1 + growth[:, None]/100) ** _EXP
+    adjusted_margins = 0.2507 * (1 - (cost_growth[:, None]/100) * _YEARS)
+    cash_flows = np.empty((7, 11))
+    cash_flows[:, 0] = -float(base_params.initial_investment)
+    cash_flows[:, 1:] = revenues * adjusted_margins
+    discount_factors = (1 + discount[:, None]/100) ** np.arange(11)
+    npvs = (cash_flows / discount_factors).sum(axis=1)
+
+    base_npv = npvs[0]
+    investment_delta = (parameters['initial_investment']['variation'] / 100
+                        * base_params.initial_investment)
+    npv_change_low = np.concatenate(([investment_delta], npvs[1::2] - base_npv))
+    npv_change_high = np.concatenate(([-investment_delta], npvs[2::2] - base_npv))
+    labels = [details['label'] for details in parameters.values()]
+
     # Sort results by absolute impact
-    sensitivity_results.sort(key=lambda x: max(abs(x['npv_change_low']), abs(x['npv_change_high'])))
-    
-    # Create tornado plot
-    fig = go.Figure()
-    
-    # Add bars for each parameter
-    for result in sensitivity_results:
-        fig.add_trace(go.Bar(
-            y=[result['parameter']],
-            x=[result['npv_change_high']],
+    order = np.argsort(np.maximum(np.abs(npv_change_low), np.abs(npv_change_high)))
+    npv_change_low = npv_change_low[order]
+    npv_change_high = npv_change_high[order]
+    labels = [labels[i] for i in order]
+
+    # Create tornado plot: one trace for all increases, one for all
+    # decreases, instead of two single-bar traces per parameter
+    return go.Figure(data=[
+        go.Bar(
+            y=labels,
+            x=npv_change_high,
             orientation='h',
             name='Increase',
             marker_color='rgba(55, 128, 191, 0.7)',
             showlegend=False
-        ))
-        
-        fig.add_trace(go.Bar(
-            y=[result['parameter']],
-            x=[result['npv_change_low']],
+        ),
+        go.Bar(
+            y=labels,
+            x=npv_change_low,
             orientation='h',
             name='Decrease',
             marker_color='rgba(219, 64, 82, 0.7)',
             showlegend=False
-        ))
-    
-    fig.update_layout(
-        title='NPV Sensitivity Analysis',
-        xaxis_title='Change in NPV ($)',
-        yaxis_title='Parameter',
-        barmode='overlay',
-        bargap=0.1,
-        template='plotly_white',
-        height=400
-    )
-    
-    return fig
+        )
+    ], layout=_TORNADO_LAYOUT)
 
+@st.fragment
 def financial_analysis_tab():
     st.title('Financial Analysis')
     
@@ -493,13 +604,8 @@ def financial_analysis_tab():
     
     with col2:
         # Industry standard default growth rates
-        if selected_revenue == 'Weak Demand':
-            default_growth = 3.0
-        elif selected_revenue == 'Above Average Demand':
-            default_growth = 12.0
-        else:
-            default_growth = 7.0
-            
+        default_growth = _FIN_GROWTH_DEFAULTS[selected_revenue]
+
         growth_rate = st.number_input(
             'Annual Revenue Growth Rate (%)',
             min_value=-2.0,
@@ -520,13 +626,8 @@ def financial_analysis_tab():
         )
     
     with col4:
-        if cost_scenario == 'Below Average Costs':
-            default_cost_growth = 2.0
-        elif cost_scenario == 'Above Average Costs':
-            default_cost_growth = 7.0
-        else:
-            default_cost_growth = 3.0
-            
+        default_cost_growth = _COST_GROWTH_DEFAULTS[cost_scenario]
+
         cost_growth_rate = st.number_input(
             'Annual Cost Growth Rate (%)',
             min_value=-5.0,
@@ -547,20 +648,23 @@ def financial_analysis_tab():
     )
     
     # Calculate financial metrics
-    base_revenue = 530899  # Base annual revenue
+    base_revenue = _BASE_REVENUE  # Base annual revenue
     base_margin = 0.2507   # Base gross margin
-    years = range(1, 11)
-    
-    # Calculate revenues and profits
-    revenues = calculate_scenario_revenues(base_revenue, selected_revenue, growth_rate, years)
-    adjusted_margins = calculate_adjusted_margins(base_margin, years, cost_growth_rate)
-    profits = [rev * margin for rev, margin in zip(revenues, adjusted_margins)]
+
+    # Calculate revenues and profits (shared cached projection)
+    revenues, adjusted_margins, profits = project_scenario(
+        selected_revenue, growth_rate, cost_growth_rate)
     
     # Calculate NPV metrics
     cash_flows = profits
     npv, irr, payback = calculate_npv_metrics(initial_investment, cash_flows, discount_rate)
     
     # Store values in session state for the investment report
+    analysis_key = (npv, irr, payback, initial_investment, cost_growth_rate,
+                    growth_rate, selected_revenue, cost_scenario)
+    analysis_changed = st.session_state.get('current_analysis_key') not in (
+        None, analysis_key)
+    st.session_state.current_analysis_key = analysis_key
     st.session_state.current_npv = npv
     st.session_state.current_irr = irr
     st.session_state.current_payback = payback
@@ -572,44 +676,28 @@ def financial_analysis_tab():
     st.session_state.current_growth_rate = growth_rate
     st.session_state.current_revenue_scenario = selected_revenue
     st.session_state.current_cost_scenario = cost_scenario
+
+    # The report tab lives outside any fragment, so a changed analysis
+    # needs a full-script rerun to refresh it
+    if analysis_changed:
+        st.rerun(scope="app")
     
     # Display Investment Metrics
     st.header('Investment Metrics')
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Net Present Value", f"${npv:,.0f}")
-    with col2:
-        st.metric("Internal Rate of Return", f"{irr:.1f}%")
-    with col3:
-        st.metric("Payback Period", f"{payback:.1f} years")
+    metrics = (
+        ("Net Present Value", f"${npv:,.0f}"),
+        ("Internal Rate of Return", f"{irr:.1f}%"),
+        ("Payback Period", f"{payback:.1f} years")
+    )
+    for col, (label, value) in zip(st.columns(3), metrics):
+        col.metric(label, value)
     
     # Revenue and Profit Projections
     st.header('Revenue and Profit Projections')
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=list(years),
-        y=revenues,
-        name='Revenue',
-        line=dict(color='blue')
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=list(years),
-        y=profits,
-        name='Profit',
-        line=dict(color='green')
-    ))
-    
-    fig.update_layout(
-        title=f"{selected_revenue} Scenario ({growth_rate:+.1f}% Growth)",
-        xaxis_title="Year",
-        yaxis_title="Amount ($)",
-        template='plotly_white'
+    fig = _build_projection_fig(
+        tuple(revenues), tuple(profits),
+        f"{selected_revenue} Scenario ({growth_rate:+.1f}% Growth)"
     )
-    
     st.plotly_chart(fig, use_container_width=True)
     
     # Margin Analysis
@@ -624,60 +712,41 @@ def financial_analysis_tab():
     - This analysis helps identify when cost management or price adjustments may be needed
     """)
     
-    fig_margins = go.Figure()
-    
-    fig_margins.add_trace(go.Scatter(
-        x=list(years),
-        y=[margin * 100 for margin in adjusted_margins],
-        name='Adjusted Gross Margin',
-        line=dict(color='blue')
-    ))
-    
-    fig_margins.add_trace(go.Scatter(
-        x=list(years),
-        y=[base_margin * 100] * len(years),
-        name='Base Gross Margin',
-        line=dict(color='gray', dash='dash')
-    ))
-    
-    fig_margins.update_layout(
-        title="Gross Margin Projection",
-        xaxis_title="Year",
-        yaxis_title="Gross Margin (%)",
-        template='plotly_white'
-    )
-    
+    fig_margins = _build_margin_fig(tuple(adjusted_margins), base_margin)
     st.plotly_chart(fig_margins, use_container_width=True)
     
     # Financial Summary
     st.header('Financial Summary')
     col1, col2 = st.columns(2)
     
-    with col1:
-        st.subheader('Revenue Metrics')
-        st.write(f"Year 1 Revenue: ${revenues[0]:,.0f}")
-        st.write(f"Year 10 Revenue: ${revenues[-1]:,.0f}")
-        st.write(f"Average Annual Revenue: ${sum(revenues)/len(revenues):,.0f}")
-        st.write(f"Total Revenue Growth: {((revenues[-1]/revenues[0] - 1) * 100):,.1f}%")
-    
-    with col2:
-        st.subheader('Profit Metrics')
-        st.write(f"Year 1 Profit: ${profits[0]:,.0f}")
-        st.write(f"Year 10 Profit: ${profits[-1]:,.0f}")
-        st.write(f"Average Annual Profit: ${sum(profits)/len(profits):,.0f}")
-        st.write(f"Final Year Margin: {(profits[-1]/revenues[-1] * 100):,.1f}%")
+    # One markdown block per column instead of a subheader plus four writes
+    col1.markdown(
+        f"### Revenue Metrics\n"
+        f"Year 1 Revenue: ${revenues[0]:,.0f}\n\n"
+        f"Year 10 Revenue: ${revenues[-1]:,.0f}\n\n"
+        f"Average Annual Revenue: ${revenues.mean():,.0f}\n\n"
+        f"Total Revenue Growth: {((revenues[-1]/revenues[0] - 1) * 100):,.1f}%"
+    )
+
+    col2.markdown(
+        f"### Profit Metrics\n"
+        f"Year 1 Profit: ${profits[0]:,.0f}\n\n"
+        f"Year 10 Profit: ${profits[-1]:,.0f}\n\n"
+        f"Average Annual Profit: ${profits.mean():,.0f}\n\n"
+        f"Final Year Margin: {(profits[-1]/revenues[-1] * 100):,.1f}%"
+    )
     
     # Sensitivity Analysis (Tornado Plot)
     st.header('Sensitivity Analysis')
     
     # Create base parameters dictionary
-    base_params = {
-        'initial_investment': initial_investment,
-        'base_revenue': base_revenue,
-        'growth_rate': growth_rate,
-        'discount_rate': discount_rate,
-        'cost_growth': cost_growth_rate
-    }
+    base_params = BaseParams(
+        initial_investment=initial_investment,
+        base_revenue=base_revenue,
+        growth_rate=growth_rate,
+        discount_rate=discount_rate,
+        cost_growth=cost_growth_rate
+    )
     
     # Create and display tornado plot
     tornado_fig = create_tornado_plot(base_params)
@@ -706,23 +775,19 @@ def generate_investment_report(npv, irr, payback, initial_investment, revenues,
     * Payback Period: {payback:.1f} years
     """
     
-    # Financial Performance
-    year_10_revenue = revenues[-1]
-    year_10_profit = profits[-1]
-    avg_revenue = sum(revenues) / len(revenues)
-    avg_profit = sum(profits) / len(profits)
-    final_margin = adjusted_margins[-1]
-    
-    start_amount = f"${revenues[0]:,.0f}"
-    end_amount = f"${revenues[-1]:,.0f}"
-    
+    # Financial Performance; sum each array once and derive the rest
+    revenues = np.asarray(revenues)
+    profits = np.asarray(profits)
+    revenue_total = revenues.sum()
+    profit_total = profits.sum()
+
     performance = f"""
     ## Financial Performance
-    * Average Annual Revenue: ${sum(revenues)/len(revenues):,.0f}
-    * Average Annual Profit: ${sum(profits)/len(profits):,.0f}
-    * Average Profit Margin: {(sum(profits)/sum(revenues))*100:.1f}%
-    * Total 10-Year Revenue: ${sum(revenues):,.0f}
-    * Total 10-Year Profit: ${sum(profits):,.0f}
+    * Average Annual Revenue: ${revenue_total/revenues.size:,.0f}
+    * Average Annual Profit: ${profit_total/profits.size:,.0f}
+    * Average Profit Margin: {(profit_total/revenue_total)*100:.1f}%
+    * Total 10-Year Revenue: ${revenue_total:,.0f}
+    * Total 10-Year Profit: ${profit_total:,.0f}
     """
     
     # Risk Assessment
@@ -803,8 +868,9 @@ def create_pdf_report(report_content):
     sections = report_content.split('##')
     for section in sections[1:]:  # Skip first empty section
         # Section title
-        title = section.split('\n')[0].strip()
-        content = '\n'.join(section.split('\n')[1:]).strip()
+        title, _, body = section.partition('\n')
+        title = title.strip()
+        content = body.strip()
         
         # Add section title
         pdf.set_font('Helvetica', 'B', 14)
@@ -814,51 +880,46 @@ def create_pdf_report(report_content):
         # Add section content
         pdf.set_font('Helvetica', '', 11)
         
-        # Process content line by line
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line:  # Skip empty lines
-                pdf.ln(5)
-                continue
-                
-            if line.startswith('*'):
-                # Handle bullet points using a simple hyphen
-                pdf.set_x(25)  # Indent
-                text = '- ' + line.strip('* ')  # Using hyphen instead of bullet
-                # Split long lines
-                words = text.split()
-                line = ''
-                for word in words:
-                    if pdf.get_string_width(line + ' ' + word) < pdf.w - 40:
-                        line += ' ' + word if line else word
-                    else:
-                        pdf.cell(0, 7, line, align='L')
-                        pdf.ln()
-                        pdf.set_x(25)
-                        line = word
-                if line:
-                    pdf.cell(0, 7, line, align='L')
-                pdf.ln(7)
+        # Group consecutive lines of the same kind and emit one multi_cell
+        # per group; fpdf wraps and advances through embedded newlines in
+        # a single call instead of one per line
+        def _kind(s):
+            # Slice compare beats a startswith dispatch for one character
+            return 'blank' if not s else 'bullet' if s[:1] == '*' else 'text'
+
+        for kind, group in groupby((line.strip() for line in content.split('\n')),
+                                   key=_kind):
+            if kind == 'blank':
+                for _ in group:
+                    pdf.ln(5)
+            elif kind == 'bullet':
+                # Bullet points rendered with a simple hyphen, indented
+                pdf.set_x(25)
+                pdf.multi_cell(0, 7, '\n'.join('- ' + s.strip('* ') for s in group),
+                               align='L', new_x='LMARGIN', new_y='NEXT')
             else:
-                # Regular text
-                # Split long lines
-                words = line.split()
-                line = ''
-                for word in words:
-                    if pdf.get_string_width(line + ' ' + word) < pdf.w - 30:
-                        line += ' ' + word if line else word
-                    else:
-                        pdf.cell(0, 7, line, align='L')
-                        pdf.ln()
-                        line = word
-                if line:
-                    pdf.cell(0, 7, line, align='L')
-                pdf.ln(7)
+                pdf.multi_cell(0, 7, '\n'.join(group), align='L',
+                               new_x='LMARGIN', new_y='NEXT')
             
         pdf.ln(10)
     
     return pdf
 
+@st.cache_data(show_spinner=False)
+def _report_assets(npv, irr, payback, initial_investment, revenues, profits,
+                   adjusted_margins, cost_growth_rate, growth_rate,
+                   selected_revenue, cost_scenario):
+    """Markdown report plus rendered PDF bytes, cached on the analysis
+    inputs so unrelated reruns skip both the text assembly and FPDF"""
+    report = generate_investment_report(
+        npv, irr, payback, initial_investment, revenues, profits,
+        adjusted_margins, cost_growth_rate, growth_rate,
+        selected_revenue, cost_scenario
+    )
+    pdf = create_pdf_report(report)
+    # fpdf2 renders straight to a buffer; no tempfile round-trip
+    return report, bytes(pdf.output())
+
 def investment_report_tab():
     st.title('Investment Analysis Report')
     
@@ -875,33 +936,23 @@ def investment_report_tab():
         selected_revenue = st.session_state.current_revenue_scenario
         cost_scenario = st.session_state.current_cost_scenario
         
-        # Generate report
-        report = generate_investment_report(
-            npv, irr, payback, initial_investment, revenues, profits, 
-            adjusted_margins, cost_growth_rate, growth_rate, 
-            selected_revenue, cost_scenario
-        )
-        
-        # Display report in Streamlit
-        st.markdown(report)
-        
-        # Create PDF
+        # Generate report and PDF (cache hit while the analysis is unchanged)
         try:
-            pdf = create_pdf_report(report)
-            
-            # Save PDF to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                pdf.output(tmp_file.name)
-                
-                # Add download button
-                with open(tmp_file.name, 'rb') as pdf_file:
-                    pdf_bytes = pdf_file.read()
-                    st.download_button(
-                        label="Download PDF Report",
-                        data=pdf_bytes,
-                        file_name="franchise_investment_analysis.pdf",
-                        mime="application/pdf"
-                    )
+            report, pdf_bytes = _report_assets(
+                npv, irr, payback, initial_investment, revenues, profits,
+                adjusted_margins, cost_growth_rate, growth_rate,
+                selected_revenue, cost_scenario
+            )
+
+            # Display report in Streamlit
+            st.markdown(report)
+
+            st.download_button(
+                label="Download PDF Report",
+                data=pdf_bytes,
+                file_name="franchise_investment_analysis.pdf",
+                mime="application/pdf"
+            )
         except Exception as e:
             st.error(f"Error generating PDF: {str(e)}")
             